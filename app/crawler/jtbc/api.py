@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Self, TypedDict
 
@@ -64,18 +65,29 @@ class JTBCNewsApiCrawler(BaseNewsCrawler):
 
     BASE_URL = "https://news-api.jtbc.co.kr/v1/get/contents/section/list/articles"
 
+    # 카테고리 병렬 수집 시 JTBC API 호스트에 동시에 열어 둘 최대 연결 수
+    MAX_CONNECTIONS_PER_HOST = 4
+
     async def fetch_articles_by_category(
-        self, category_code: int
+        self, category_code: int, session: aiohttp.ClientSession | None = None
     ) -> list[ArticleDTO[JtbcArticleMetadata]]:
         """
         특정 카테고리(섹션)의 뉴스 기사 수집
 
         Args:
             category_code: 카테고리 코드 (예: 10 - 정치)
+            session: 재사용할 HTTP 세션. 없으면 이 호출 전용 세션을 생성합니다.
 
         Returns:
             list[ArticleDTO[JtbcArticleMetadata]]: 수집된 기사 목록
         """
+        # 단독 호출 시에는 전용 세션을 열어 그대로 위임
+        if session is None:
+            async with aiohttp.ClientSession() as own_session:
+                return await self.fetch_articles_by_category(
+                    category_code, session=own_session
+                )
+
         # 카테고리명 조회
         category_name = CATEGORY_MAP.get(category_code, f"카테고리{category_code}")
 
@@ -86,78 +98,75 @@ class JTBCNewsApiCrawler(BaseNewsCrawler):
         articles: list[ArticleDTO[JtbcArticleMetadata]] = []
 
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {
-                    "pageNo": 1,
-                    "pageSize": 10,
-                    "articleListType": "ARTICLE",
-                    "sectionIdx": category_code,
-                }
-
-                async with session.get(self.BASE_URL, params=params) as response:
-                    if response.status != 200:
-                        logger.error(
-                            f"[JTBC] '{category_name}' 카테고리 요청 실패 - 상태 코드: {response.status}"
+            params = {
+                "pageNo": 1,
+                "pageSize": 10,
+                "articleListType": "ARTICLE",
+                "sectionIdx": category_code,
+            }
+
+            async with session.get(self.BASE_URL, params=params) as response:
+                if response.status != 200:
+                    logger.error(
+                        f"[JTBC] '{category_name}' 카테고리 요청 실패 - 상태 코드: {response.status}"
+                    )
+                    return articles
+
+                data = await response.json()
+                news_list = data.get("data", {}).get("list", [])
+
+                for item in news_list:
+                    try:
+                        # 필수 필드 확인
+                        title = item.get("articleTitle")
+                        article_idx = item.get("articleIdx")
+
+                        if not title or not article_idx:
+                            continue
+
+                        # Pydantic 모델 변환 (BaseApiModel에서 자동으로 None 값 처리)
+                        article = JtbcArticle.model_validate(item)
+
+                        # 메타데이터 및 컨텐츠 추출
+                        url = f"https://news.jtbc.co.kr/article/{article.article_idx}"
+                        content = self._extract_content(
+                            article.article_inner_text_content
+                        )
+                        published_at = self._parse_date(article.publication_date)
+                        author = article.journalist_name
+
+                        # 비디오 정보 추출
+                        has_video = article.is_video_view
+                        video_id = None
+                        if vod_info := article.vod_info:
+                            has_video = True
+                            video_id = vod_info.get("videoIdx")
+
+                        # 메타데이터 생성
+                        metadata = JtbcArticleMetadata(
+                            platform="JTBC",
+                            category=category_name,
+                            article_id=article.article_idx,
+                            published_at=published_at,
+                            collected_at=datetime.now(),
+                            updated_at=datetime.now(),
+                            has_video=has_video,
+                            video_id=video_id,
+                        )
+
+                        # ArticleDTO 생성
+                        article_dto = ArticleDTO[JtbcArticleMetadata](
+                            title=article.article_title,
+                            url=url,
+                            content=content,
+                            author=author,
+                            metadata=metadata,
                         )
-                        return articles
-
-                    data = await response.json()
-                    news_list = data.get("data", {}).get("list", [])
-
-                    for item in news_list:
-                        try:
-                            # 필수 필드 확인
-                            title = item.get("articleTitle")
-                            article_idx = item.get("articleIdx")
-
-                            if not title or not article_idx:
-                                continue
-
-                            # Pydantic 모델 변환 (BaseApiModel에서 자동으로 None 값 처리)
-                            article = JtbcArticle.model_validate(item)
-
-                            # 메타데이터 및 컨텐츠 추출
-                            url = (
-                                f"https://news.jtbc.co.kr/article/{article.article_idx}"
-                            )
-                            content = self._extract_content(
-                                article.article_inner_text_content
-                            )
-                            published_at = self._parse_date(article.publication_date)
-                            author = article.journalist_name
-
-                            # 비디오 정보 추출
-                            has_video = article.is_video_view
-                            video_id = None
-                            if vod_info := article.vod_info:
-                                has_video = True
-                                video_id = vod_info.get("videoIdx")
-
-                            # 메타데이터 생성
-                            metadata = JtbcArticleMetadata(
-                                platform="JTBC",
-                                category=category_name,
-                                article_id=article.article_idx,
-                                published_at=published_at,
-                                collected_at=datetime.now(),
-                                updated_at=datetime.now(),
-                                has_video=has_video,
-                                video_id=video_id,
-                            )
-
-                            # ArticleDTO 생성
-                            article_dto = ArticleDTO[JtbcArticleMetadata](
-                                title=article.article_title,
-                                url=url,
-                                content=content,
-                                author=author,
-                                metadata=metadata,
-                            )
-
-                            articles.append(article_dto)
-
-                        except Exception as e:
-                            logger.warning(f"[JTBC] 기사 정보 처리 중 오류: {str(e)}")
+
+                        articles.append(article_dto)
+
+                    except Exception as e:
+                        logger.warning(f"[JTBC] 기사 정보 처리 중 오류: {str(e)}")
 
         except Exception as e:
             logger.error(
@@ -193,16 +202,25 @@ class JTBCNewsApiCrawler(BaseNewsCrawler):
     async def fetch_articles(self) -> list[ArticleDTO[JtbcArticleMetadata]]:
         """
         JTBC 뉴스 기사 수집
-        모든 카테고리의 기사를 수집합니다.
+        모든 카테고리의 기사를 병렬로 수집합니다.
 
         Returns:
             list[ArticleDTO[JtbcArticleMetadata]]: 수집된 기사 목록
         """
         all_articles: list[ArticleDTO[JtbcArticleMetadata]] = []
 
-        # CATEGORY_MAP의 모든 카테고리에 대해 기사 수집
-        for category_code in CATEGORY_MAP:
-            category_articles = await self.fetch_articles_by_category(category_code)
+        # 하나의 세션(커넥션 풀)을 모든 카테고리 요청이 공유하여
+        # 동일 호스트에 대한 연결을 재사용 (카테고리 순서 유지)
+        connector = aiohttp.TCPConnector(limit_per_host=self.MAX_CONNECTIONS_PER_HOST)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            results = await asyncio.gather(
+                *(
+                    self.fetch_articles_by_category(category_code, session=session)
+                    for category_code in CATEGORY_MAP
+                )
+            )
+
+        for category_articles in results:
             all_articles.extend(category_articles)
 
         logger.info(f"[JTBC] 전체 {len(all_articles)}개의 기사 수집 완료")
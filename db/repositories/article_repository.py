@@ -1,10 +1,18 @@
 from typing import Any, Dict, List, Optional
 
+from pymongo.errors import BulkWriteError
+
 from app.models.article import ArticleModel
+from common.utils.logger import get_logger
 
 from ..mongodb import MongoDB
 from .interfaces.article_repository import BaseArticleRepository
 
+logger = get_logger(__name__)
+
+# MongoDB 중복 키 오류 코드
+DUPLICATE_KEY_ERROR_CODE = 11000
+
 
 class MongoArticleRepository(BaseArticleRepository):
     """
@@ -15,12 +23,66 @@ class MongoArticleRepository(BaseArticleRepository):
 
     collection_name = ArticleModel.collection_name
 
+    # insert_many 한 번에 전송할 최대 문서 수
+    BULK_INSERT_BATCH_SIZE = 500
+
     async def save_article(self, article: ArticleModel) -> Any:
         """MongoDB에 기사를 저장하고 ObjectId를 반환합니다."""
         db = MongoDB.get_database()
         result = await db[self.collection_name].insert_one(article.model_dump())
         return result.inserted_id
 
+    async def save_articles(self, articles: List[ArticleModel]) -> Dict[str, int]:
+        """
+        MongoDB에 여러 기사를 insert_many로 일괄 저장하고 결과별 기사 수를 반환합니다.
+
+        ordered=False로 전송하므로 일부 문서가 거부되어도 나머지 문서는 계속 저장됩니다.
+        중복 키(11000)로 거부된 문서는 duplicates, 그 외 오류는 failed로 집계합니다.
+        """
+        counts = {"inserted": 0, "duplicates": 0, "failed": 0}
+        if not articles:
+            return counts
+
+        collection = MongoDB.get_database()[self.collection_name]
+
+        for start in range(0, len(articles), self.BULK_INSERT_BATCH_SIZE):
+            batch = articles[start : start + self.BULK_INSERT_BATCH_SIZE]
+            documents = [article.model_dump() for article in batch]
+
+            try:
+                result = await collection.insert_many(documents, ordered=False)
+                counts["inserted"] += len(result.inserted_ids)
+            except BulkWriteError as e:
+                counts["inserted"] += e.details.get("nInserted", 0)
+
+                for error in e.details.get("writeErrors", []):
+                    if error.get("code") == DUPLICATE_KEY_ERROR_CODE:
+                        # 중복 확인 이후 다른 작업이 먼저 저장한 기사
+                        counts["duplicates"] += 1
+                    else:
+                        counts["failed"] += 1
+                        logger.error(
+                            f"기사 일괄 저장 중 문서 저장 실패 "
+                            f"(code={error.get('code')}): {error.get('errmsg')}"
+                        )
+
+                for error in e.details.get("writeConcernErrors", []):
+                    logger.error(
+                        f"기사 일괄 저장 중 쓰기 확인 오류 "
+                        f"(code={error.get('code')}): {error.get('errmsg')}"
+                    )
+            except Exception as e:
+                # 네트워크 오류 등: 앞서 저장된 청크 수는 유지하고
+                # 결과를 알 수 없는 현재 청크와 남은 기사는 실패로 집계
+                remaining = len(articles) - start
+                counts["failed"] += remaining
+                logger.error(
+                    f"기사 일괄 저장 중 오류 발생, {remaining}개 기사 저장 실패: {str(e)}"
+                )
+                break
+
+        return counts
+
     async def find_by_platform(self, platform: str) -> List[Dict[str, Any]]:
         """MongoDB에서 특정 플랫폼의 기사를 조회합니다."""
         db = MongoDB.get_database()
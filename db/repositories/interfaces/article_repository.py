@@ -29,6 +29,20 @@ class BaseArticleRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def save_articles(self, articles: List[ArticleModel]) -> Dict[str, int]:
+        """
+        여러 기사를 한 번에 저장소에 저장합니다.
+
+        Args:
+            articles: 저장할 기사 모델 목록
+
+        Returns:
+            결과별 기사 수
+            (inserted: 저장됨, duplicates: 중복으로 거부됨, failed: 그 외 저장 실패)
+        """
+        pass
+
     @abstractmethod
     async def find_by_platform(self, platform: str) -> List[Dict[str, Any]]:
         """
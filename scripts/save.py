@@ -47,6 +47,10 @@ async def save_to_database(articles: List[ArticleDTO]) -> int:
     dup_count: int = 0
     error_count: int = 0
 
+    # 신규 기사는 모아 두었다가 한 번에 저장 (이번 배치 내 중복은 unique_id로 제거)
+    new_articles: List[ArticleModel] = []
+    pending_ids: set[str] = set()
+
     for idx, article_dto in enumerate(articles, 1):
         try:
             # 진행 상황 출력 (100개마다)
@@ -76,15 +80,30 @@ async def save_to_database(articles: List[ArticleDTO]) -> int:
                 # DTO → Document 모델 변환
                 article_model: ArticleModel = ArticleModel.from_article_dto(article_dto)
 
-                # DB 저장
-                await article_repository.save_article(article_model)
-                new_count += 1
+                if article_model.unique_id in pending_ids:
+                    dup_count += 1
+                    continue
+
+                pending_ids.add(article_model.unique_id)
+                new_articles.append(article_model)
             else:
                 dup_count += 1
 
         except Exception as e:
             error_count += 1
-            logger.error(f"기사 저장 중 오류 발생: {str(e)}")
+            logger.error(f"기사 중복 확인 및 변환 중 오류 발생: {str(e)}")
+
+    # 신규 기사 일괄 저장 (insert_many, ordered=False)
+    try:
+        save_result = await article_repository.save_articles(new_articles)
+        new_count = save_result["inserted"]
+        # 중복 확인 이후 다른 작업이 먼저 저장해 거부된 기사는 중복으로 집계
+        dup_count += save_result["duplicates"]
+        error_count += save_result["failed"]
+    except Exception as e:
+        # DB 연결이 없는 경우 등 저장을 시작하지 못한 경우
+        error_count += len(new_articles)
+        logger.error(f"기사 일괄 저장 중 오류 발생: {str(e)}")
 
     # 실행 시간 계산
     elapsed = (datetime.now() - start_time).total_seconds()